@@ -7,7 +7,7 @@ import tempfile
 import msgpack  # Faster caching alternative to pickle
 import hashlib  # Added import
 from PyQt5.QtWidgets import QMessageBox
-from PyQt5.QtGui import QImage, QPixmap
+from PyQt5.QtGui import QImage, QImageReader, QPixmap
 import xml.etree.ElementTree as ET
 
 # Optional DXF support
@@ -115,15 +115,23 @@ class CADBackground:
                 logger.error(f"Image file not found: {image_path}")
                 return False
                 
-            # Load the image file
-            image = QImage(image_path)
-            if image.isNull():
+            # Read the dimensions from the image header; salabim decodes the file itself
+            reader = QImageReader(image_path)
+            if not reader.canRead():
                 logger.error(f"Failed to load image: {image_path}")
                 return False
+            size = reader.size()
+            if not size.isValid():
+                # Some formats only report their size once decoded
+                image = reader.read()
+                if image.isNull():
+                    logger.error(f"Failed to load image: {image_path}")
+                    return False
+                size = image.size()
                 
             # Get image dimensions
-            width = image.width()
-            height = image.height()
+            width = size.width()
+            height = size.height()
             logger.info(f"Loaded image with dimensions {width}x{height}")
             
             # Create a background using salabim's Animate
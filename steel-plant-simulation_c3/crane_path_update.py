@@ -55,11 +55,8 @@ update_path_new = """    def update_path(self):
         if self.route_type == "Crane" and hasattr(self, 'is_dynamic') and self.is_dynamic:
             # Find the bay containing the crane
             bay = None
-            if hasattr(self.scene(), 'bay_items'):
-                for bay_item in self.scene().bay_items:
-                    if hasattr(self.start_item, 'bay_name') and bay_item.name == self.start_item.bay_name:
-                        bay = bay_item
-                        break
+            if hasattr(self.scene(), 'bay_index') and hasattr(self.start_item, 'bay_name'):
+                bay = self.scene().bay_index.get(self.start_item.bay_name)
             
             if bay:
                 # Crane spans bay width, moves along length
@@ -120,48 +117,8 @@ if 'class LayoutScene(QGraphicsScene):' in content:
     if 'def check_crane_collision(self' not in content:
         content = content[:insert_pos] + collision_method + content[insert_pos:]
 
-# Update itemChange in EquipmentItem class to implement collision detection and bay constraints
-if 'def itemChange(self, change, value):' in content:
-    item_change_start = content.find('def itemChange(self, change, value):')
-    item_change_end = content.find('return super().itemChange(change, value)', item_change_start)
-    
-    old_item_change = content[item_change_start:item_change_end + len('return super().itemChange(change, value)')]
-    
-    new_item_change = """def itemChange(self, change, value):
-        # Handle item changes, particularly position changes
-        if change == QGraphicsItem.ItemPositionChange and self.scene():
-            new_pos = value
-            grid_size = 10
-            new_pos.setX(round(new_pos.x() / grid_size) * grid_size)
-            new_pos.setY(round(new_pos.y() / grid_size) * grid_size)
-            
-            # Special handling for cranes
-            if self.equipment_type == "Crane":
-                # Check for bay constraints
-                for bay in self.scene().bay_items:
-                    if bay.name == self.bay_name:
-                        bay_rect = bay.boundingRect().translated(bay.pos())
-                        # Keep the crane within the bay's horizontal bounds
-                        new_pos.setX(max(bay_rect.left(), min(new_pos.x(), bay_rect.right() - self.width)))
-                        # Keep Y position constant for cranes (they move horizontally along bay)
-                        new_pos.setY(new_pos.y())
-                        break
-                
-                # Check for collision with other cranes in the same bay
-                temp_pos = self.pos()  # Store original position
-                self.setPos(new_pos)   # Temporarily set new position to check collision
-                if hasattr(self.scene(), 'check_crane_collision') and self.scene().check_crane_collision(self):
-                    self.setPos(temp_pos)  # Revert to original position if collision would occur
-                    return temp_pos
-                self.setPos(temp_pos)  # Reset to original position until change is confirmed
-            
-            if hasattr(self.scene(), "position_changed"):
-                self.scene().position_changed.emit(self)
-            return new_pos
-        return super().itemChange(change, value)"""
-    
-    if old_item_change in content:
-        content = content.replace(old_item_change, new_item_change)
+# EquipmentItem.itemChange is left alone: it marks the cached layout dirty and refreshes
+# attached routes, and replacing it here would silently drop both
 
 # Write updated content back to file
 with open('equipment_layout_editor.py', 'w') as file:
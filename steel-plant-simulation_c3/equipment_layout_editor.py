@@ -1,4 +1,6 @@
 import os
+import re
+import math
 import json
 from PyQt5.QtWidgets import (QWidget, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox, QSpinBox, QGroupBox, QToolBar, QAction, QFileDialog, QGraphicsView, QGraphicsScene, QGraphicsItem, QGraphicsRectItem, QGraphicsEllipseItem, QGraphicsPathItem, QGraphicsTextItem, QApplication, QMessageBox, QMenu, QFrame, QInputDialog, QListWidget, QListWidgetItem, QSplitter)
 from PyQt5.QtGui import (QIcon, QPainter, QPen, QBrush, QColor, QPixmap, QImage, QFont, QFontMetrics, QPainterPath, QDrag, QTransform)
@@ -7,6 +9,8 @@ import logging
 import numpy as np
 import random
 import copy
+from collections import namedtuple
+from contextlib import contextmanager
 from ladle_path_editor import LadlePathEditor
 from shared_items import RoutePointItem, RoutePathItem
 
@@ -18,6 +22,32 @@ handler.setFormatter(formatter)
 logger.addHandler(handler)
 logger.setLevel(logging.INFO)
 
+# Equipment types offered when adding equipment
+EQUIPMENT_TYPES = ("EAF", "LMF", "DEGAS", "CASTER")
+
+# Config keys written by the editor and by save_layout
+LAYOUT_KEYS = ("equipment_positions", "bays", "routes", "ladle_paths")
+
+# Appearance per equipment type, built once so all items of a type share the same brush and pen
+EquipmentStyle = namedtuple("EquipmentStyle", ["brush", "pen", "hover_brush"])
+
+EQUIPMENT_STYLES = {
+    "EAF": EquipmentStyle(QBrush(QColor(200, 100, 100, 150)), QPen(QColor(150, 50, 50), 2),
+                          QBrush(QColor(255, 150, 150, 200))),
+    "LMF": EquipmentStyle(QBrush(QColor(100, 200, 100, 150)), QPen(QColor(50, 150, 50), 2),
+                          QBrush(QColor(150, 255, 150, 200))),
+    "DEGAS": EquipmentStyle(QBrush(QColor(100, 100, 200, 150)), QPen(QColor(50, 50, 150), 2),
+                            QBrush(QColor(150, 150, 255, 200))),
+    "CASTER": EquipmentStyle(QBrush(QColor(200, 200, 100, 150)), QPen(QColor(150, 150, 50), 2),
+                             QBrush(QColor(255, 255, 150, 200))),
+}
+DEFAULT_EQUIPMENT_STYLE = EquipmentStyle(QBrush(QColor(150, 150, 150, 150)), QPen(QColor(100, 100, 100), 2),
+                                         QBrush(QColor(200, 200, 200, 200)))
+
+BAY_BRUSH = QBrush(QColor(200, 200, 200, 100))
+BAY_HOVER_BRUSH = QBrush(QColor(220, 220, 220, 150))
+BAY_PEN = QPen(QColor(150, 150, 150, 200), 2, Qt.DashDotLine)
+
 class EquipmentItem(QGraphicsRectItem):
     """Graphics item representing a piece of equipment in the layout."""
     
@@ -30,91 +60,60 @@ class EquipmentItem(QGraphicsRectItem):
         self.setFlag(QGraphicsItem.ItemIsMovable, True)
         self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
         self.setAcceptHoverEvents(True)
+        # Static shape; keep it rasterized until it changes or the zoom does
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         
         # Set up appearance based on equipment type
-        if equipment_type == "EAF":
-            self.setBrush(QBrush(QColor(200, 100, 100, 150)))
-            self.setPen(QPen(QColor(150, 50, 50), 2))
-        elif equipment_type == "LMF":
-            self.setBrush(QBrush(QColor(100, 200, 100, 150)))
-            self.setPen(QPen(QColor(50, 150, 50), 2))
-        elif equipment_type == "DEGAS":
-            self.setBrush(QBrush(QColor(100, 100, 200, 150)))
-            self.setPen(QPen(QColor(50, 50, 150), 2))
-        elif equipment_type == "CASTER":
-            self.setBrush(QBrush(QColor(200, 200, 100, 150)))
-            self.setPen(QPen(QColor(150, 150, 50), 2))
-        else:
-            self.setBrush(QBrush(QColor(150, 150, 150, 150)))
-            self.setPen(QPen(QColor(100, 100, 100), 2))
+        self.type_style = EQUIPMENT_STYLES.get(equipment_type, DEFAULT_EQUIPMENT_STYLE)
+        self.setBrush(self.type_style.brush)
+        self.setPen(self.type_style.pen)
             
         # Add text label
         self.text_item = QGraphicsTextItem(f"{name}\n({equipment_type})", self)
         self.text_item.setPos(10, 10)
         self.text_item.setDefaultTextColor(Qt.black)
-        
-    def paint(self, painter, option, widget=None):
-        """Paint the equipment item."""
-        super().paint(painter, option, widget)
+        self.text_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         
     def hoverEnterEvent(self, event):
         """Handle hover enter events."""
-        if self.equipment_type == "EAF":
-            self.setBrush(QBrush(QColor(255, 150, 150, 200)))
-        elif self.equipment_type == "LMF":
-            self.setBrush(QBrush(QColor(150, 255, 150, 200)))
-        elif self.equipment_type == "DEGAS":
-            self.setBrush(QBrush(QColor(150, 150, 255, 200)))
-        elif self.equipment_type == "CASTER":
-            self.setBrush(QBrush(QColor(255, 255, 150, 200)))
-        else:
-            self.setBrush(QBrush(QColor(200, 200, 200, 200)))
+        self.setBrush(self.type_style.hover_brush)
         super().hoverEnterEvent(event)
         
     def hoverLeaveEvent(self, event):
         """Handle hover leave events."""
-        if self.equipment_type == "EAF":
-            self.setBrush(QBrush(QColor(200, 100, 100, 150)))
-        elif self.equipment_type == "LMF":
-            self.setBrush(QBrush(QColor(100, 200, 100, 150)))
-        elif self.equipment_type == "DEGAS":
-            self.setBrush(QBrush(QColor(100, 100, 200, 150)))
-        elif self.equipment_type == "CASTER":
-            self.setBrush(QBrush(QColor(200, 200, 100, 150)))
-        else:
-            self.setBrush(QBrush(QColor(150, 150, 150, 150)))
+        self.setBrush(self.type_style.brush)
         super().hoverLeaveEvent(event)
         
+    def itemChange(self, change, value):
+        """Mark the layout as modified and refresh attached routes when the item is moved."""
+        if change == QGraphicsItem.ItemPositionHasChanged:
+            scene = self.scene()
+            if scene is not None:
+                scene.mark_dirty()
+                scene.update_routes_for(self)
+        return super().itemChange(change, value)
+        
     def get_data(self):
         """Get the equipment item data."""
+        rect = self.rect()
         return {
             "equipment_type": self.equipment_type,
             "equipment_id": self.equipment_id,
             "name": self.name,
             "x": self.x(),
             "y": self.y(),
-            "width": self.rect().width(),
-            "height": self.rect().height()
+            "width": rect.width(),
+            "height": rect.height()
         }
         
-    def contextMenuEvent(self, event):
-        """Display context menu when right-clicking on the equipment."""
-        menu = QMenu()
-        name_action = menu.addAction("Edit Name")
-        delete_action = menu.addAction("Delete")
-        
-        selected_action = menu.exec_(event.screenPos())
-        
-        if selected_action == name_action:
-            new_name, ok = QInputDialog.getText(None, "Edit Equipment Name", "New name:", text=self.name)
-            if ok and new_name:
-                self.name = new_name
-                self.text_item.setPlainText(f"{new_name}\n({self.equipment_type})")
-        elif selected_action == delete_action:
-            # Remove the item from the scene
-            scene = self.scene()
-            if scene:
-                scene.removeItem(self)
+    def edit_name(self):
+        """Prompt for a new equipment name and update the label."""
+        new_name, ok = QInputDialog.getText(None, "Edit Equipment Name", "New name:", text=self.name)
+        if ok and new_name:
+            self.name = new_name
+            self.text_item.setPlainText(f"{new_name}\n({self.equipment_type})")
+            if self.scene():
+                self.scene().mark_dirty()
 
 class BayItem(QGraphicsRectItem):
     """Graphics item representing a bay area in the layout."""
@@ -127,87 +126,264 @@ class BayItem(QGraphicsRectItem):
         self.setFlag(QGraphicsItem.ItemIsMovable, True)
         self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
         self.setAcceptHoverEvents(True)
+        # Static shape; keep it rasterized until it changes or the zoom does
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         
         # Set up appearance
-        self.setBrush(QBrush(QColor(200, 200, 200, 100)))
-        self.setPen(QPen(QColor(150, 150, 150, 200), 2, Qt.DashDotLine))
+        self.setBrush(BAY_BRUSH)
+        self.setPen(BAY_PEN)
             
         # Add text label
         self.text_item = QGraphicsTextItem(f"Bay: {name}", self)
         self.text_item.setPos(10, 10)
         self.text_item.setDefaultTextColor(Qt.darkGray)
-        
-    def paint(self, painter, option, widget=None):
-        """Paint the bay item."""
-        super().paint(painter, option, widget)
+        self.text_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         
     def hoverEnterEvent(self, event):
         """Handle hover enter events."""
-        self.setBrush(QBrush(QColor(220, 220, 220, 150)))
+        self.setBrush(BAY_HOVER_BRUSH)
         super().hoverEnterEvent(event)
         
     def hoverLeaveEvent(self, event):
         """Handle hover leave events."""
-        self.setBrush(QBrush(QColor(200, 200, 200, 100)))
+        self.setBrush(BAY_BRUSH)
         super().hoverLeaveEvent(event)
         
+    def itemChange(self, change, value):
+        """Mark the layout as modified when the bay is moved."""
+        if change == QGraphicsItem.ItemPositionHasChanged:
+            scene = self.scene()
+            if scene is not None:
+                scene.mark_dirty()
+        return super().itemChange(change, value)
+        
     def get_data(self):
         """Get the bay item data."""
+        rect = self.rect()
         return {
             "bay_id": self.bay_id,
             "name": self.name,
             "x": self.x(),
             "y": self.y(),
-            "width": self.rect().width(),
-            "height": self.rect().height()
+            "width": rect.width(),
+            "height": rect.height()
         }
         
-    def contextMenuEvent(self, event):
-        """Display context menu when right-clicking on the bay."""
-        menu = QMenu()
-        name_action = menu.addAction("Edit Name")
-        delete_action = menu.addAction("Delete")
-        
-        selected_action = menu.exec_(event.screenPos())
-        
-        if selected_action == name_action:
-            new_name, ok = QInputDialog.getText(None, "Edit Bay Name", "New name:", text=self.name)
-            if ok and new_name:
-                self.name = new_name
-                self.text_item.setPlainText(f"Bay: {new_name}")
-        elif selected_action == delete_action:
-            # Remove the item from the scene
+    def edit_name(self):
+        """Prompt for a new bay name and update the label."""
+        new_name, ok = QInputDialog.getText(None, "Edit Bay Name", "New name:", text=self.name)
+        if ok and new_name:
             scene = self.scene()
             if scene:
-                scene.removeItem(self)
+                scene.rename_bay(self, new_name)
+            else:
+                self.name = new_name
+            self.text_item.setPlainText(f"Bay: {new_name}")
 
 class LayoutScene(QGraphicsScene):
     """Custom graphics scene for the layout editor."""
     
+    # Bay changes for widgets that list bays, as (action, name, old_name). The action
+    # is "add", "remove" or "rename"; "reset" means the whole bay set was replaced.
+    # The editor itself does not listen; the bay combos from the ladle path
+    # integration (ladle_path_code_snippets.py, on_bay_changed) do.
+    bay_changed = pyqtSignal(str, str, str)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Set while bulk_load() runs; per-bay notifications give way to one reset
+        self._bulk_loading = False
         self.setSceneRect(0, 0, 1200, 800)
+        # Grid cell pixmap repeated by drawBackground; rebuilt when grid_size changes
+        self._grid_tile = None
         self.grid_size = 20
-        self.draw_grid()
         self.ladle_path_mode = False
         self.current_path_points = []
         self.current_path_type = "ladle_car"
         self.routes = []
+        # Typed item buckets keyed by id(item); dict insertion order doubles as save order
+        self.equipment_items = {}
+        self.bay_items = {}
+        self.route_points = {}
+        # Bays keyed by name for lookups from equipment and routes; names are not
+        # unique, so each entry is the first bay with that name in insertion order
+        self.bay_index = {}
+        # Every bay with a given name, in insertion order
+        self._bays_by_name = {}
+        # Routes attached to each endpoint, keyed by id(endpoint)
+        self.routes_by_item = {}
+        # Routes waiting for a path rebuild; flushed once per event loop pass
+        self._pending_routes = {}
+        self._route_update_timer = QTimer(self)
+        self._route_update_timer.setSingleShot(True)
+        self._route_update_timer.setInterval(0)
+        self._route_update_timer.timeout.connect(self._flush_route_updates)
+        # Set whenever the layout changes; cleared once the layout data is collected
+        self._dirty = True
+
+    @property
+    def grid_size(self):
+        """Spacing of the background grid and of path point snapping."""
+        return self._grid_size
+
+    @grid_size.setter
+    def grid_size(self, size):
+        self._grid_size = size
+        self._grid_tile = None
+        self.invalidate(self.sceneRect(), QGraphicsScene.BackgroundLayer)
+
+    @contextmanager
+    def bulk_load(self):
+        """Suspend BSP indexing while many items are added at once.
+        
+        The index is rebuilt once when the block exits rather than updated
+        for every addItem call.
+        """
+        index_method = self.itemIndexMethod()
+        self.setItemIndexMethod(QGraphicsScene.NoIndex)
+        self._bulk_loading = True
+        try:
+            yield self
+        finally:
+            self._bulk_loading = False
+            self.setItemIndexMethod(index_method)
+            self.bay_changed.emit("reset", "", "")
+
+    def mark_dirty(self):
+        """Flag the layout as modified since the last collection."""
+        self._dirty = True
+
+    def mark_clean(self):
+        """Record that the current layout has been collected."""
+        self._dirty = False
+
+    def is_dirty(self):
+        """Return whether the layout changed since it was last marked clean."""
+        return self._dirty
+
+    def addItem(self, item):
+        """Add an item to the scene, filing it into the typed item indexes."""
+        super().addItem(item)
+        if isinstance(item, EquipmentItem):
+            self.equipment_items[id(item)] = item
+        elif isinstance(item, BayItem):
+            self.bay_items[id(item)] = item
+            self._bays_by_name.setdefault(item.name, []).append(item)
+            self.bay_index.setdefault(item.name, item)
+            if not self._bulk_loading:
+                self.bay_changed.emit("add", item.name, "")
+        elif isinstance(item, RoutePointItem):
+            self.route_points[id(item)] = item
+        elif isinstance(item, RoutePathItem):
+            for endpoint in (item.start_item, item.end_item):
+                self.routes_by_item.setdefault(id(endpoint), []).append(item)
+        self._dirty = True
+
+    def removeItem(self, item):
+        """Remove an item from the scene and drop it from the item indexes."""
+        if self.bay_items.pop(id(item), None) is not None:
+            self._unindex_bay(item, item.name)
+            self.bay_changed.emit("remove", item.name, "")
+        elif isinstance(item, RoutePathItem):
+            for endpoint in (item.start_item, item.end_item):
+                routes = self.routes_by_item.get(id(endpoint))
+                if routes and item in routes:
+                    routes.remove(item)
+        else:
+            self.equipment_items.pop(id(item), None)
+            self.route_points.pop(id(item), None)
+            self.routes_by_item.pop(id(item), None)
+        super().removeItem(item)
+        self._dirty = True
+
+    def clear(self):
+        """Remove all items from the scene and reset the item bookkeeping."""
+        super().clear()
+        self.equipment_items = {}
+        self.bay_items = {}
+        self.route_points = {}
+        self.bay_index = {}
+        self._bays_by_name = {}
+        self.routes_by_item = {}
+        self._pending_routes = {}
+        self.routes = []
+        self.current_path_points = []
+        self._dirty = True
+        # A bulk load announces its own reset once it finishes
+        if not self._bulk_loading:
+            self.bay_changed.emit("reset", "", "")
+
+    def rename_bay(self, bay, new_name):
+        """Rename a bay, keeping the name index and bay listeners in step."""
+        old_name = bay.name
+        bay.name = new_name
+        if id(bay) in self.bay_items:
+            self._unindex_bay(bay, old_name)
+            # Rebuild in bay order so the renamed bay takes its place among namesakes
+            same_name = [b for b in self.bay_items.values() if b.name == new_name]
+            self._bays_by_name[new_name] = same_name
+            self.bay_index[new_name] = same_name[0]
+        self._dirty = True
+        self.bay_changed.emit("rename", new_name, old_name)
+
+    def _unindex_bay(self, bay, name):
+        """Drop bay from the name indexes under name, re-pointing to any namesake."""
+        bays = self._bays_by_name.get(name)
+        if bays is None or bay not in bays:
+            return
+        bays.remove(bay)
+        if bays:
+            self.bay_index[name] = bays[0]
+        else:
+            del self._bays_by_name[name]
+            self.bay_index.pop(name, None)
+
+    def update_routes_for(self, item):
+        """Queue the routes attached to a moved item for a path rebuild."""
+        routes = self.routes_by_item.get(id(item))
+        if not routes:
+            return
+        # Saved route data follows its endpoints
+        self._dirty = True
+        for route in routes:
+            self._pending_routes[id(route)] = route
+        self._route_update_timer.start()
+
+    def _flush_route_updates(self):
+        """Rebuild each queued route path once, however many moves were queued."""
+        pending = self._pending_routes
+        self._pending_routes = {}
+        for route in pending.values():
+            if route.scene() is self:
+                route.update_path()
 
     def draw_grid(self):
-        """Draw a grid on the scene."""
-        grid_pen = QPen(QColor(230, 230, 230))
-        
-        # Draw horizontal grid lines
-        for y in range(0, int(self.height()), self.grid_size):
-            self.addLine(0, y, self.width(), y, grid_pen)
-            
-        # Draw vertical grid lines
-        for x in range(0, int(self.width()), self.grid_size):
-            self.addLine(x, 0, x, self.height(), grid_pen)
+        """Render one grid cell to the pixmap tiled by drawBackground."""
+        grid = self.grid_size
+        tile = QPixmap(grid, grid)
+        tile.fill(Qt.transparent)
+        painter = QPainter(tile)
+        painter.setPen(QPen(QColor(230, 230, 230)))
+        painter.drawLine(0, 0, grid, 0)
+        painter.drawLine(0, 0, 0, grid)
+        painter.end()
+        self._grid_tile = tile
+        
+    def drawBackground(self, painter, rect):
+        """Tile the cached grid cell over the exposed part of the scene rect."""
+        super().drawBackground(painter, rect)
+        area = rect.intersected(self.sceneRect())
+        if area.isEmpty():
+            return
+        if self._grid_tile is None:
+            self.draw_grid()
+        grid = self.grid_size
+        painter.drawTiledPixmap(area, self._grid_tile, QPointF(area.left() % grid, area.top() % grid))
     
     def set_ladle_path_mode(self, enabled, path_type="ladle_car"):
         """Set whether ladle path drawing mode is enabled."""
+        if enabled == self.ladle_path_mode and path_type == self.current_path_type:
+            return
         self.ladle_path_mode = enabled
         self.current_path_type = path_type
         if not enabled:
@@ -218,9 +394,11 @@ class LayoutScene(QGraphicsScene):
         pos = event.scenePos()
         
         if self.ladle_path_mode:
-            # Snap to grid
-            x = round(pos.x() / self.grid_size) * self.grid_size
-            y = round(pos.y() / self.grid_size) * self.grid_size
+            # Snap to the nearest grid line in integer arithmetic; working in half units
+            # rounds correctly for odd grid sizes and for negative coordinates
+            grid = self.grid_size
+            x = (math.floor(2 * pos.x()) + grid) // (2 * grid) * grid
+            y = (math.floor(2 * pos.y()) + grid) // (2 * grid) * grid
             
             # Create a new route point
             point_item = RoutePointItem(x, y)
@@ -239,16 +417,19 @@ class LayoutScene(QGraphicsScene):
             
     def clear_routes(self):
         """Clear all routes from the scene."""
+        # Every route and route point goes, so drop their index entries wholesale
+        # instead of unpicking them one removeItem at a time
+        remove = super().removeItem
         for route in self.routes:
-            self.removeItem(route)
+            remove(route)
+        for item in self.route_points.values():
+            remove(item)
         self.routes = []
-        
-        # Also remove all route points
-        for item in self.items():
-            if isinstance(item, RoutePointItem):
-                self.removeItem(item)
-                
+        self.route_points = {}
+        self.routes_by_item = {}
+        self._pending_routes = {}
         self.current_path_points = []
+        self._dirty = True
 
 class LayoutView(QGraphicsView):
     """Custom graphics view for the layout editor."""
@@ -259,10 +440,46 @@ class LayoutView(QGraphicsView):
         self.setRenderHint(QPainter.TextAntialiasing)
         self.setRenderHint(QPainter.SmoothPixmapTransform)
         self.setDragMode(QGraphicsView.RubberBandDrag)
-        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        # Every item and the background/foreground set their own pen and brush before drawing
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.AnchorUnderMouse)
         
+        # Context menus are built once per item type and reused on every right-click
+        self._context_item = None
+        self._context_menus = {}
+        for item_type in (EquipmentItem, BayItem):
+            menu = QMenu(self)
+            menu.addAction("Edit Name", self._edit_context_item_name)
+            menu.addAction("Delete", self._delete_context_item)
+            self._context_menus[item_type] = menu
+        
+    def contextMenuEvent(self, event):
+        """Display the cached context menu for the item under the cursor."""
+        item = self.itemAt(event.pos())
+        if item is not None:
+            # Right-clicks on a label belong to the item that owns it
+            item = item.topLevelItem()
+        menu = self._context_menus.get(type(item))
+        if menu is None:
+            super().contextMenuEvent(event)
+            return
+            
+        self._context_item = item
+        menu.exec_(event.globalPos())
+        self._context_item = None
+        
+    def _edit_context_item_name(self):
+        """Rename the item the context menu was opened on."""
+        if self._context_item is not None:
+            self._context_item.edit_name()
+            
+    def _delete_context_item(self):
+        """Remove the item the context menu was opened on from the scene."""
+        if self._context_item is not None:
+            self.scene().removeItem(self._context_item)
+        
     def wheelEvent(self, event):
         """Handle mouse wheel events for zooming."""
         if event.modifiers() & Qt.ControlModifier:
@@ -279,7 +496,7 @@ class LayoutView(QGraphicsView):
             
     def reset_zoom(self):
         """Reset the view to its original zoom level."""
-        self.setTransform(QTransform())
+        self.resetTransform()
 
 def load_equipment_data():
     """Load equipment data from a JSON file."""
@@ -301,9 +518,14 @@ def load_equipment_data():
             
     return equipment_data
 
+# Numeric part of generated ids such as "eaf_3" or "bay_12"
+_ID_NUMBER = re.compile(r"[^_]*_(\d+)(?:_|$)")
+
 class EquipmentLayoutEditor(QDialog):
     """Dialog for editing the equipment layout."""
     
+    _LAYOUT_FILTER = "JSON Files (*.json)"
+    
     def __init__(self, parent=None, current_config=None):
         super().__init__(parent)
         self.setWindowTitle("Equipment Layout Editor")
@@ -312,6 +534,9 @@ class EquipmentLayoutEditor(QDialog):
         self.equipment_counter = 0
         self.bay_counter = 0
         self.ladle_path_editor = None
+        self._layout_cache = None
+        # equipment_data.json contents, read on the first add_equipment
+        self._equipment_data = None
         
         # Load configuration if provided
         if current_config:
@@ -344,8 +569,7 @@ class EquipmentLayoutEditor(QDialog):
         toolbar.addWidget(equipment_label)
         
         self.equipment_combo = QComboBox()
-        for equipment_type in ["EAF", "LMF", "DEGAS", "CASTER"]:
-            self.equipment_combo.addItem(equipment_type)
+        self.equipment_combo.addItems(EQUIPMENT_TYPES)
         toolbar.addWidget(self.equipment_combo)
         
         add_equipment_btn = QPushButton("Add")
@@ -432,8 +656,10 @@ class EquipmentLayoutEditor(QDialog):
         
         main_layout.addWidget(splitter)
         
-        # Save and close button at the bottom
+        # Status line and save and close button at the bottom
         bottom_layout = QHBoxLayout()
+        self.status_label = QLabel("Ready")
+        bottom_layout.addWidget(self.status_label)
         save_close_btn = QPushButton("Save and Close")
         save_close_btn.clicked.connect(self.save_and_close)
         bottom_layout.addStretch()
@@ -447,7 +673,9 @@ class EquipmentLayoutEditor(QDialog):
         equipment_id = f"{equipment_type.lower()}_{self.equipment_counter}"
         
         # Get equipment dimensions from data
-        equipment_data = load_equipment_data()
+        if self._equipment_data is None:
+            self._equipment_data = load_equipment_data()
+        equipment_data = self._equipment_data
         width = equipment_data.get(equipment_type, {}).get("width", 100)
         height = equipment_data.get(equipment_type, {}).get("height", 100)
         
@@ -480,7 +708,11 @@ class EquipmentLayoutEditor(QDialog):
             
             # Show the ladle path editor dialog
             if not self.ladle_path_editor:
-                self.ladle_path_editor = LadlePathEditor(self, self.config.get("ladle_paths", []))
+                # The path editor edits paths in place; give it its own path dicts so
+                # a cancelled dialog leaves the caller's config untouched
+                paths = [dict(path, waypoints=list(path.get("waypoints", [])))
+                         for path in self.config.get("ladle_paths", [])]
+                self.ladle_path_editor = LadlePathEditor(self, paths)
             
             # Show the dialog non-modal
             self.ladle_path_editor.show()
@@ -521,29 +753,35 @@ class EquipmentLayoutEditor(QDialog):
         """Reset the zoom level."""
         self.view.reset_zoom()
         
-    def save_layout(self):
-        """Save the layout to a JSON file."""
+    def collect_layout_data(self):
+        """Collect equipment, bay and route data from the scene.
+        
+        The result is cached and only rebuilt when the scene has been
+        modified since the last call.
+        """
+        if self._layout_cache is not None and not self.scene.is_dirty():
+            return self._layout_cache
+            
         # Collect equipment data
-        equipment_data = []
-        bay_data = []
-        
-        for item in self.scene.items():
-            if isinstance(item, EquipmentItem):
-                equipment_data.append(item.get_data())
-            elif isinstance(item, BayItem):
-                bay_data.append(item.get_data())
+        equipment_data = [item.get_data() for item in self.scene.equipment_items.values()]
+                
+        # Bays are kept in insertion order by the scene
+        bay_data = [bay.get_data() for bay in self.scene.bay_items.values()]
                 
         # Collect route data
-        route_data = []
-        for route in self.scene.routes:
-            route_data.append(route.get_data())
+        route_data = [route.get_data() for route in self.scene.routes]
                 
-        # Create the layout data
-        layout_data = {
+        self._layout_cache = {
             "equipment_positions": equipment_data,
             "bays": bay_data,
             "routes": route_data
         }
+        self.scene.mark_clean()
+        return self._layout_cache
+        
+    def save_layout(self):
+        """Save the layout to a JSON file."""
+        layout_data = dict(self.collect_layout_data())
         
         # Get ladle paths from editor if available
         if self.ladle_path_editor:
@@ -552,154 +790,103 @@ class EquipmentLayoutEditor(QDialog):
             layout_data["ladle_paths"] = self.config["ladle_paths"]
         
         # Save to a JSON file
-        file_path, _ = QFileDialog.getSaveFileName(self, "Save Layout", "", "JSON Files (*.json)")
+        file_path, _ = QFileDialog.getSaveFileName(self, "Save Layout", "", self._LAYOUT_FILTER)
         if file_path:
             with open(file_path, "w") as f:
                 json.dump(layout_data, f, indent=4)
                 
-            QMessageBox.information(self, "Layout Saved", f"Layout saved to {file_path}")
+            # Report on the status line; a modal box would block until dismissed
+            self.status_label.setText(f"Layout saved to {file_path}")
         
     def load_layout(self):
         """Load a layout from a JSON file."""
-        file_path, _ = QFileDialog.getOpenFileName(self, "Load Layout", "", "JSON Files (*.json)")
+        file_path, _ = QFileDialog.getOpenFileName(self, "Load Layout", "", self._LAYOUT_FILTER)
         if file_path:
             try:
                 with open(file_path, "r") as f:
                     layout_data = json.load(f)
                     
-                # Clear the scene
-                self.scene.clear()
-                self.scene.draw_grid()
-                self.equipment_list.clear()
+                # Rebuild the scene and list from the new configuration, putting the
+                # previous one back if the file turns out to be incomplete
+                previous = (self.config, self.equipment_counter, self.bay_counter)
+                self.config = layout_data
                 self.equipment_counter = 0
                 self.bay_counter = 0
-                
-                # Load equipment
-                for equip_data in layout_data.get("equipment_positions", []):
-                    item = EquipmentItem(
-                        equip_data["x"],
-                        equip_data["y"],
-                        equip_data["width"],
-                        equip_data["height"],
-                        equip_data["equipment_type"],
-                        equip_data["equipment_id"],
-                        equip_data["name"]
-                    )
-                    self.scene.addItem(item)
-                    self.equipment_list.addItem(f"{equip_data['name']} ({equip_data['equipment_type']})")
-                    
-                    # Update counter
-                    if equip_data["equipment_id"].startswith(equip_data["equipment_type"].lower()):
-                        try:
-                            counter = int(equip_data["equipment_id"].split("_")[1])
-                            self.equipment_counter = max(self.equipment_counter, counter)
-                        except (IndexError, ValueError):
-                            pass
-                
-                # Load bays
-                for bay_data in layout_data.get("bays", []):
-                    item = BayItem(
-                        bay_data["x"],
-                        bay_data["y"],
-                        bay_data["width"],
-                        bay_data["height"],
-                        bay_data["bay_id"],
-                        bay_data["name"]
-                    )
-                    self.scene.addItem(item)
-                    self.equipment_list.addItem(f"Bay: {bay_data['name']}")
-                    
-                    # Update counter
-                    if bay_data["bay_id"].startswith("bay_"):
-                        try:
-                            counter = int(bay_data["bay_id"].split("_")[1])
-                            self.bay_counter = max(self.bay_counter, counter)
-                        except (IndexError, ValueError):
-                            pass
-                
-                # Update configuration
-                self.config = layout_data
+                try:
+                    self.load_layout_data()
+                except KeyError:
+                    self.config, self.equipment_counter, self.bay_counter = previous
+                    self.load_layout_data()
+                    raise
                 
                 # Update ladle path editor if open
                 if self.ladle_path_editor:
                     self.ladle_path_editor.set_path_data(layout_data.get("ladle_paths", []))
                     
-                QMessageBox.information(self, "Layout Loaded", f"Layout loaded from {file_path}")
+                self.status_label.setText(f"Layout loaded from {file_path}")
                 
-            except (FileNotFoundError, json.JSONDecodeError) as e:
+            except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
                 QMessageBox.warning(self, "Error Loading Layout", f"Failed to load layout: {str(e)}")
                 
     def load_layout_data(self):
         """Load layout data from the configuration."""
-        # Clear the scene
-        self.scene.clear()
-        self.scene.draw_grid()
         self.equipment_list.clear()
         
-        # Load equipment positions
-        for equip_data in self.config.get("equipment_positions", []):
-            item = EquipmentItem(
-                equip_data["x"],
-                equip_data["y"],
-                equip_data.get("width", 100),
-                equip_data.get("height", 100),
-                equip_data["equipment_type"],
-                equip_data["equipment_id"],
-                equip_data.get("name", equip_data["equipment_id"])
-            )
-            self.scene.addItem(item)
-            self.equipment_list.addItem(f"{equip_data.get('name', equip_data['equipment_id'])} ({equip_data['equipment_type']})")
+        # List labels are added in one batch once the items are loaded
+        list_labels = []
+        add_label = list_labels.append
+        add_item = self.scene.addItem
+        with self.scene.bulk_load():
+            # Clearing inside the bulk load leaves bay listeners a single reset
+            self.scene.clear()
             
-            # Update counter
-            if equip_data["equipment_id"].startswith(equip_data["equipment_type"].lower()):
-                try:
-                    counter = int(equip_data["equipment_id"].split("_")[1])
-                    self.equipment_counter = max(self.equipment_counter, counter)
-                except (IndexError, ValueError):
-                    pass
-        
-        # Load bays
-        for bay_data in self.config.get("bays", []):
-            item = BayItem(
-                bay_data["x"],
-                bay_data["y"],
-                bay_data.get("width", 300),
-                bay_data.get("height", 200),
-                bay_data["bay_id"],
-                bay_data.get("name", bay_data["bay_id"])
-            )
-            self.scene.addItem(item)
-            self.equipment_list.addItem(f"Bay: {bay_data.get('name', bay_data['bay_id'])}")
+            # Load equipment positions
+            for equip_data in self.config.get("equipment_positions", []):
+                equipment_type = equip_data["equipment_type"]
+                equipment_id = equip_data["equipment_id"]
+                name = equip_data.get("name", equipment_id)
+                add_item(EquipmentItem(
+                    equip_data["x"],
+                    equip_data["y"],
+                    equip_data.get("width", 100),
+                    equip_data.get("height", 100),
+                    equipment_type,
+                    equipment_id,
+                    name
+                ))
+                add_label(f"{name} ({equipment_type})")
             
-            # Update counter
-            if bay_data["bay_id"].startswith("bay_"):
-                try:
-                    counter = int(bay_data["bay_id"].split("_")[1])
-                    self.bay_counter = max(self.bay_counter, counter)
-                except (IndexError, ValueError):
-                    pass
+                # Update counter
+                if equipment_id.startswith(equipment_type.lower()):
+                    match = _ID_NUMBER.match(equipment_id)
+                    if match:
+                        self.equipment_counter = max(self.equipment_counter, int(match.group(1)))
+        
+            # Load bays
+            for bay_data in self.config.get("bays", []):
+                bay_id = bay_data["bay_id"]
+                name = bay_data.get("name", bay_id)
+                add_item(BayItem(
+                    bay_data["x"],
+                    bay_data["y"],
+                    bay_data.get("width", 300),
+                    bay_data.get("height", 200),
+                    bay_id,
+                    name
+                ))
+                add_label(f"Bay: {name}")
+            
+                # Update counter
+                if bay_id.startswith("bay_"):
+                    match = _ID_NUMBER.match(bay_id)
+                    if match:
+                        self.bay_counter = max(self.bay_counter, int(match.group(1)))
+        self.equipment_list.addItems(list_labels)
         
     def save_and_close(self):
         """Save the layout to the configuration and close the dialog."""
-        # Collect equipment data
-        equipment_data = []
-        bay_data = []
-        
-        for item in self.scene.items():
-            if isinstance(item, EquipmentItem):
-                equipment_data.append(item.get_data())
-            elif isinstance(item, BayItem):
-                bay_data.append(item.get_data())
-                
-        # Collect route data
-        route_data = []
-        for route in self.scene.routes:
-            route_data.append(route.get_data())
-                
-        # Update the configuration
-        self.config["equipment_positions"] = equipment_data
-        self.config["bays"] = bay_data
-        self.config["routes"] = route_data
+        # Update the configuration; copy so the cached layout lists are not shared with it
+        self.config.update(copy.deepcopy(self.collect_layout_data()))
         
         # Get ladle paths from editor if available
         if self.ladle_path_editor:
@@ -713,15 +900,27 @@ class EquipmentLayoutEditor(QDialog):
         """Get the current configuration."""
         return self.config
 
-def show_equipment_layout_editor(current_config=None):
-    """Show the equipment layout editor dialog."""
+def show_equipment_layout_editor(sim_service=None, parent=None):
+    """Show the equipment layout editor dialog.
+    
+    The simulation config is shared with the editor rather than copied; the
+    editor only writes to it when the layout is saved on accept.
+    """
     app = QCoreApplication.instance()
     if not app:
         app = QApplication([])
 
-    dialog = EquipmentLayoutEditor(current_config=current_config)
+    config = sim_service.config if sim_service is not None else None
+    dialog = EquipmentLayoutEditor(parent, current_config=config)
     if dialog.exec_() == QDialog.Accepted:
-        return dialog.get_config()
+        edited = dialog.get_config()
+        if config is not None and edited is not config:
+            # A layout file was loaded in the dialog; it replaces the live layout, so
+            # drop layout keys it lacks and give the live config its own lists
+            for key in LAYOUT_KEYS:
+                config.pop(key, None)
+            config.update(copy.deepcopy(edited))
+        return edited
     return None
 
 if __name__ == "__main__":
@@ -5,10 +5,24 @@ into equipment_layout_editor.py.
 """
 
 # ----- ATTRIBUTES FOR EQUIPMENT LAYOUT EDITOR -----
-# Add to EquipmentLayoutEditor.__init__ after existing initializations
+# Add to EquipmentLayoutEditor.__init__ after existing initializations, before create_ui()
 self.path_drawing = False
 self.current_path_waypoints = []
-self.current_path_item = None
+# Created by the path controls in create_ui
+self.bay_selector = None
+# Tab widget found by _tab_widget(); looked up on first use
+self._tabs = None
+# Per-bay next free path id and {path_id: list position}, built in load_layout_data
+self._next_path_id = {}
+self._path_slots = {}
+
+# ----- CACHED TAB WIDGET LOOKUP -----
+# findChild walks the editor's whole child tree; requires "from PyQt5 import sip"
+def _tab_widget(self):
+    """Return the editor's tab widget, looking it up on first use."""
+    if self._tabs is None or sip.isdeleted(self._tabs):
+        self._tabs = self.findChild(QTabWidget)
+    return self._tabs
 
 # ----- TOGGLE LADLE PATH MODE METHOD -----
 def toggle_ladle_path_mode(self, checked):
@@ -20,7 +34,7 @@ def toggle_ladle_path_mode(self, checked):
     self.path_drawing = checked
     if checked:
         self.current_path_waypoints = []
-        self.current_path_item = None
+        self.scene.clear_draft_path()
     
     # Disable other modes when ladle path mode is enabled
     if checked:
@@ -30,19 +44,20 @@ def toggle_ladle_path_mode(self, checked):
             self.bay_action.setChecked(False)
             
         # Switch to the Ladle Car Paths tab
-        for i in range(self.findChild(QTabWidget).count()):
-            if self.findChild(QTabWidget).tabText(i) == "Ladle Car Paths":
-                self.findChild(QTabWidget).setCurrentIndex(i)
+        tabs = self._tab_widget()
+        for i in range(tabs.count()):
+            if tabs.tabText(i) == "Ladle Car Paths":
+                tabs.setCurrentIndex(i)
                 break
         
         # Enable drawing mode in the ladle path editor
-        if hasattr(self, "ladle_path_editor"):
+        if self.ladle_path_editor is not None:
             self.ladle_path_editor.toggle_path_drawing(True)
         
         self.status_label.setText("Ladle path mode: Click to add waypoints, finish by clicking button again")
     else:
         # Disable drawing mode in the ladle path editor
-        if hasattr(self, "ladle_path_editor"):
+        if self.ladle_path_editor is not None:
             self.ladle_path_editor.toggle_path_drawing(False)
         self.status_label.setText("Ready")
 
@@ -50,8 +65,8 @@ def toggle_ladle_path_mode(self, checked):
 def start_drawing_path(self):
     """Start drawing a new ladle car path."""
     # Find the bay selector or use the LadlePathEditor's bay combo
-    bay_selector = getattr(self, "bay_selector", None)
-    if not bay_selector and hasattr(self, "ladle_path_editor"):
+    bay_selector = self.bay_selector
+    if bay_selector is None and self.ladle_path_editor is not None:
         bay_selector = self.ladle_path_editor.bay_combo
         
     if not bay_selector or not bay_selector.currentText():
@@ -65,7 +80,7 @@ def start_drawing_path(self):
     # Initialize path state
     self.path_drawing = True
     self.current_path_waypoints = []
-    self.current_path_item = None
+    self.scene.clear_draft_path()
     logger.info(f"Started drawing path for bay {bay_selector.currentText()}")
 
 def finish_drawing_path(self):
@@ -75,67 +90,69 @@ def finish_drawing_path(self):
         return
         
     # Find the bay selector or use the LadlePathEditor's bay combo
-    bay_selector = getattr(self, "bay_selector", None)
-    if not bay_selector and hasattr(self, "ladle_path_editor"):
+    bay_selector = self.bay_selector
+    if bay_selector is None and self.ladle_path_editor is not None:
         bay_selector = self.ladle_path_editor.bay_combo
         
     bay_name = bay_selector.currentText()
     
     # Get the next path ID or use the one from the LadlePathEditor
-    path_id = None
-    if hasattr(self, "ladle_path_editor"):
+    if self.ladle_path_editor is not None:
         path_id = self.ladle_path_editor.path_id_spin.value()
     else:
-        # Find the next available path ID
-        path_id = 1
-        if "ladle_car_paths" in self.config and bay_name in self.config["ladle_car_paths"]:
-            path_ids = [p.get("path_id", 0) for p in self.config["ladle_car_paths"][bay_name]]
-            if path_ids:
-                path_id = max(path_ids) + 1
+        path_id = self._next_path_id.get(bay_name, 1)
+    self._next_path_id[bay_name] = max(self._next_path_id.get(bay_name, 1), path_id + 1)
     
-    # Save path to config
+    # Save path to the scene, replacing any existing path with the same ID;
+    # save_layout copies scene.ladle_car_paths into the config
     path = {"path_id": path_id, "waypoints": self.current_path_waypoints}
-    if "ladle_car_paths" not in self.config:
-        self.config["ladle_car_paths"] = {}
-    if bay_name not in self.config["ladle_car_paths"]:
-        self.config["ladle_car_paths"][bay_name] = []
-        
-    # Check if path ID already exists and replace it
-    found = False
-    for i, existing_path in enumerate(self.config["ladle_car_paths"].get(bay_name, [])):
-        if existing_path.get("path_id") == path_id:
-            self.config["ladle_car_paths"][bay_name][i] = path
-            found = True
-            break
-            
-    if not found:
-        self.config["ladle_car_paths"][bay_name].append(path)
-        
-    # Reset path drawing state
+    slots = self._path_slots.setdefault(bay_name, {})
+    slot = slots.setdefault(path_id, len(self.scene.ladle_car_paths.get(bay_name, [])))
+    
+    # Reset path drawing state; the saved path is drawn by the scene from here on
     self.path_drawing = False
     self.current_path_waypoints = []
-    self.current_path_item = None
+    self.scene.clear_draft_path()
     
-    # Update the scene and disable path mode
-    self.scene.update()
+    # Store the path and rebuild only its polyline, then disable path mode
+    self.scene.set_ladle_car_path(bay_name, slot, path)
     self.path_action.setChecked(False)
     self.toggle_ladle_path_mode(False)
     
     # Update the ladle path editor's list if it exists
-    if hasattr(self, "ladle_path_editor"):
+    if self.ladle_path_editor is not None:
         self.ladle_path_editor.update_paths_list()
         
     logger.info(f"Finished path {path_id} for bay {bay_name}")
 
+# ----- SHARED IDENTITY TRANSFORM -----
+# Add at module scope in equipment_layout_editor.py so hit tests don't allocate a transform per event
+_IDENTITY_TRANSFORM = QTransform()
+
+# ----- ROUTE ENDPOINT HIT TEST -----
+# Add to LayoutScene; a small halo means a route can be finished without hitting an item exactly
+_ROUTE_HIT_HALO = 5
+
+def route_endpoint_at(self, pos):
+    """Return the topmost equipment item or route point near pos, or None."""
+    halo = QRectF(pos.x() - _ROUTE_HIT_HALO, pos.y() - _ROUTE_HIT_HALO,
+                  2 * _ROUTE_HIT_HALO, 2 * _ROUTE_HIT_HALO)
+    for item in self.items(halo, Qt.IntersectsItemShape, Qt.DescendingOrder, _IDENTITY_TRANSFORM):
+        # Labels are children of the equipment they name
+        item = item.topLevelItem()
+        if isinstance(item, (EquipmentItem, RoutePointItem)):
+            return item
+    return None
+
 # ----- SCENE MOUSE RELEASE EVENT HANDLING -----
 # This should replace or be merged with the existing mouseReleaseEvent in LayoutScene
 def mouseReleaseEvent(self, event):
     """Handle mouse release events."""
     if event.button() == Qt.LeftButton and self.route_mode and self.route_start_item:
-        end_item = self.itemAt(event.scenePos(), QTransform())
+        end_item = self.route_endpoint_at(event.scenePos())
         
         # Check if we need to create a route point
-        if not isinstance(end_item, (EquipmentItem, RoutePointItem)) or end_item == self.route_start_item:
+        if end_item is None or end_item == self.route_start_item:
             # Create a route point at mouse position
             pos = event.scenePos()
             end_item = self.add_route_point(pos.x(), pos.y())
@@ -151,7 +168,7 @@ def mouseReleaseEvent(self, event):
         return
         
     # Handle ladle path mode clicks
-    elif hasattr(self, "ladle_path_mode") and self.ladle_path_mode:
+    elif self.ladle_path_mode:
         pos = event.scenePos()
         
         # Find the equipment layout editor
@@ -161,30 +178,15 @@ def mouseReleaseEvent(self, event):
                 # Add waypoint to editor's list
                 window.current_path_waypoints.append({"x": pos.x(), "y": pos.y()})
                 
-                # Draw visual representation
-                if len(window.current_path_waypoints) > 1:
-                    p1 = window.current_path_waypoints[-2]
-                    p2 = window.current_path_waypoints[-1]
-                    
-                    # Draw a line segment
-                    from PyQt5.QtGui import QPainterPath
-                    path = QPainterPath()
-                    path.moveTo(p1["x"], p1["y"])
-                    path.lineTo(p2["x"], p2["y"])
-                    
-                    path_item = QGraphicsPathItem(path)
-                    path_item.setPen(QPen(QColor(0, 128, 255), 2, Qt.DashLine))
-                    self.addItem(path_item)
-                
-                # Draw waypoint as a dot
-                ellipse_item = QGraphicsEllipseItem(pos.x() - 5, pos.y() - 5, 10, 10)
-                ellipse_item.setBrush(QBrush(QColor(0, 128, 255)))
-                ellipse_item.setPen(QPen(Qt.black))
-                self.addItem(ellipse_item)
+                # The draft is painted in drawForeground; repaint just the new segment and dot
+                self._draft_polyline.append(pos)
+                start = self._draft_polyline[-2] if len(self._draft_polyline) > 1 else pos
+                pad = LADLE_CAR_DRAFT_DOT_PEN.widthF() / 2
+                self.update(QRectF(start, pos).normalized().adjusted(-pad, -pad, pad, pad))
                 
                 # Also forward to ladle path editor if it exists
-                if hasattr(window, "ladle_path_editor"):
-                    window.ladle_path_editor.add_waypoint(pos)
+                if window.ladle_path_editor is not None:
+                    window.ladle_path_editor.add_waypoint(pos.x(), pos.y())
                     
                 event.accept()
                 return
@@ -198,17 +200,23 @@ def mouseReleaseEvent(self, event):
             if ok and name:
                 self.removeItem(self.temp_bay_rect)
                 bay = BayItem(name, rect.x(), rect.y(), rect.width(), rect.height())
+                # addItem indexes the bay and announces it through bay_changed
                 self.addItem(bay)
-                self.bay_items.append(bay)
-                QApplication.instance().activeWindow().update_bay_combo()
         self.bay_start_pos = None
         self.temp_bay_rect = None
-        self.update()
+        # addItem/removeItem schedule repaints of their own rects; no full-scene update needed
         event.accept()
         return
     super().mouseReleaseEvent(event)
 
 # ----- UI CONTROLS FOR LADLE PATH DRAWING -----
+# Add at module scope in equipment_layout_editor.py; the buttons are matched by object name
+PATH_BUTTON_STYLE = (
+    "QPushButton#addPathBtn, QPushButton#finishPathBtn { color: white; font-size: 14px; padding: 5px; }"
+    "QPushButton#addPathBtn { background-color: #4CAF50; }"
+    "QPushButton#finishPathBtn { background-color: #FF9800; }"
+)
+
 # Add this to the controls_layout in EquipmentLayoutEditor.create_ui
 bay_selector_label = QLabel("Select Bay for Path:")
 self.bay_selector = QComboBox()
@@ -217,75 +225,181 @@ controls_layout.addWidget(bay_selector_label)
 controls_layout.addWidget(self.bay_selector)
 
 add_path_btn = QPushButton("Add Path")
-add_path_btn.setStyleSheet("background-color: #4CAF50; color: white; font-size: 14px; padding: 5px;")
+add_path_btn.setObjectName("addPathBtn")
 add_path_btn.clicked.connect(self.start_drawing_path)
 add_path_btn.setToolTip("Start drawing a ladle car path for the selected bay")
 controls_layout.addWidget(add_path_btn)
 
 finish_path_btn = QPushButton("Finish Path")
-finish_path_btn.setStyleSheet("background-color: #FF9800; color: white; font-size: 14px; padding: 5px;")
+finish_path_btn.setObjectName("finishPathBtn")
 finish_path_btn.clicked.connect(self.finish_drawing_path)
 finish_path_btn.setToolTip("Finish the current path")
 controls_layout.addWidget(finish_path_btn)
 
+# Style both buttons from one sheet on the dialog, parsed once
+self.setStyleSheet(PATH_BUTTON_STYLE)
+
 # ----- PATH VISUALIZATION IN LAYOUTSCENE -----
-def draw_ladle_car_paths(self, painter):
-    """Draw all ladle car paths."""
-    for bay_name, paths in self.ladle_car_paths.items():
-        for path in paths:
-            waypoints = path.get("waypoints", [])
-            if len(waypoints) < 2:
-                continue
-                
-            # Draw path lines
-            painter.setPen(QPen(QColor(0, 128, 255), 2, Qt.SolidLine))
-            for i in range(len(waypoints) - 1):
-                p1 = waypoints[i]
-                p2 = waypoints[i + 1]
-                painter.drawLine(p1["x"], p1["y"], p2["x"], p2["y"])
-                
-            # Draw waypoints
-            painter.setBrush(QBrush(QColor(0, 128, 255, 180)))
-            for wp in waypoints:
-                painter.drawEllipse(QPointF(wp["x"], wp["y"]), 5, 5)
+# Add at module scope in equipment_layout_editor.py; shared by every paint
+LADLE_CAR_PATH_PEN = QPen(QColor(0, 128, 255), 2, Qt.SolidLine)
+# A wide round-capped pen draws each waypoint as a 10px dot in a single drawPoints call
+LADLE_CAR_WAYPOINT_PEN = QPen(QColor(0, 128, 255, 180), 10, Qt.SolidLine, Qt.RoundCap)
+# Path being drawn, before finish_drawing_path saves it
+LADLE_CAR_DRAFT_PEN = QPen(QColor(0, 128, 255), 2, Qt.DashLine)
+LADLE_CAR_DRAFT_DOT_PEN = QPen(QColor(0, 128, 255), 10, Qt.SolidLine, Qt.RoundCap)
+
+# Add to LayoutScene.__init__
+self.ladle_car_paths = {}
+# (polyline, padded bounding rect) per drawable path, keyed by (bay name, list position)
+self._ladle_car_polylines = {}
+# Waypoints of the path being drawn; painted directly, never added as items
+self._draft_polyline = QPolygonF()
 
-# Call this from the scene's paint method
-def paint(self, painter, option, widget=None):
+def set_ladle_car_paths(self, ladle_car_paths):
+    """Store ladle car paths and rebuild the polylines drawn for them; used for bulk loads."""
+    # Repaint only where paths were or now are, not the whole scene
+    dirty = QRectF()
+    for _, bounds in self._ladle_car_polylines.values():
+        dirty = dirty.united(bounds)
+    self.ladle_car_paths = ladle_car_paths
+    self._ladle_car_polylines = {}
+    for bay_name, paths in ladle_car_paths.items():
+        for slot, path in enumerate(paths):
+            entry = self._ladle_car_polyline(path)
+            if entry is not None:
+                self._ladle_car_polylines[bay_name, slot] = entry
+                dirty = dirty.united(entry[1])
+    if not dirty.isNull():
+        self.update(dirty)
+
+def set_ladle_car_path(self, bay_name, slot, path):
+    """Store one bay's path at a list position and rebuild only its polyline."""
+    bay_paths = self.ladle_car_paths.setdefault(bay_name, [])
+    if slot == len(bay_paths):
+        bay_paths.append(path)
+    else:
+        bay_paths[slot] = path
+        
+    # Repaint where this path was and where it is now
+    old = self._ladle_car_polylines.pop((bay_name, slot), None)
+    if old is not None:
+        self.update(old[1])
+    entry = self._ladle_car_polyline(path)
+    if entry is not None:
+        self._ladle_car_polylines[bay_name, slot] = entry
+        self.update(entry[1])
+
+def _ladle_car_polyline(self, path):
+    """Return (polyline, padded bounding rect) for a path, or None if it has too few waypoints."""
+    waypoints = path.get("waypoints", [])
+    if len(waypoints) < 2:
+        return None
+    polyline = QPolygonF([QPointF(wp["x"], wp["y"]) for wp in waypoints])
+    # Bounds are padded by the waypoint dot radius so they cover everything drawn
+    pad = LADLE_CAR_WAYPOINT_PEN.widthF() / 2
+    return polyline, polyline.boundingRect().adjusted(-pad, -pad, pad, pad)
+
+def draw_ladle_car_paths(self, painter, rect):
+    """Draw the ladle car paths that intersect the exposed rect."""
+    visible = [polyline for polyline, bounds in self._ladle_car_polylines.values() if bounds.intersects(rect)]
+    if not visible:
+        return
+        
+    # All paths share one pen per layer: lines first, then every waypoint dot on top
+    painter.setPen(LADLE_CAR_PATH_PEN)
+    for polyline in visible:
+        painter.drawPolyline(polyline)
+    painter.setPen(LADLE_CAR_WAYPOINT_PEN)
+    for polyline in visible:
+        painter.drawPoints(polyline)
+
+def clear_draft_path(self):
+    """Discard the path being drawn and repaint where it was."""
+    if self._draft_polyline.isEmpty():
+        return
+    pad = LADLE_CAR_DRAFT_DOT_PEN.widthF() / 2
+    dirty = self._draft_polyline.boundingRect().adjusted(-pad, -pad, pad, pad)
+    self._draft_polyline = QPolygonF()
+    self.update(dirty)
+
+# QGraphicsScene has no paint(); draw the paths over the items from drawForeground
+def drawForeground(self, painter, rect):
     """Paint custom scene content."""
-    super().paint(painter, option, widget)
+    super().drawForeground(painter, rect)
     # Draw paths
-    self.draw_ladle_car_paths(painter)
+    self.draw_ladle_car_paths(painter, rect)
+    # Draw the path being drawn on top
+    if not self._draft_polyline.isEmpty():
+        painter.setPen(LADLE_CAR_DRAFT_PEN)
+        painter.drawPolyline(self._draft_polyline)
+        painter.setPen(LADLE_CAR_DRAFT_DOT_PEN)
+        painter.drawPoints(self._draft_polyline)
 
 # ----- SAVE AND LOAD LADLE CAR PATHS -----
 # Add to save_layout method
-# Save ladle car paths from scene to config
+# Save ladle car paths from scene to config; the scene holds the only edited copy
 self.config["ladle_car_paths"] = self.scene.ladle_car_paths
 
 # Add to load_layout_data method
 # Load ladle car paths from config to scene
-self.scene.ladle_car_paths = self.config.get("ladle_car_paths", {})
+ladle_car_paths = self.config.get("ladle_car_paths", {})
+self.scene.set_ladle_car_paths(ladle_car_paths)
+# Index each bay's paths once so finish_drawing_path never rescans them
+self._path_slots = {}
+self._next_path_id = {}
+for bay_name, paths in ladle_car_paths.items():
+    slots = {p.get("path_id", 0): i for i, p in enumerate(paths)}
+    self._path_slots[bay_name] = slots
+    self._next_path_id[bay_name] = max(slots, default=0) + 1
+
+# ----- INCREMENTAL BAY COMBO UPDATES -----
+# Connect in EquipmentLayoutEditor.create_ui after the scene is created:
+# self.scene.bay_changed.connect(self.on_bay_changed)
+def on_bay_changed(self, action, name, old_name):
+    """Apply a single bay change to the bay combos instead of rebuilding them."""
+    if action == "reset":
+        self.update_bay_combo()
+        return
+        
+    combos = [self.bay_combo]
+    if self.bay_selector is not None:
+        combos.append(self.bay_selector)
+        
+    for combo in combos:
+        if action == "add":
+            combo.addItem(name)
+            continue
+        index = combo.findText(old_name if action == "rename" else name)
+        if index < 0:
+            continue
+        if action == "rename":
+            combo.setItemText(index, name)
+        else:
+            combo.removeItem(index)
 
 # ----- UPDATE BAY COMBO METHOD -----
+# Full resync; used when the scene's bay set is replaced (bay_changed "reset")
 def update_bay_combo(self):
     """Update bay combo box with current bay items."""
-    current_text = self.bay_combo.currentText()
-    self.bay_combo.clear()
-    for bay in self.scene.bay_items:
-        self.bay_combo.addItem(bay.name)
+    # LayoutScene.bay_items is a dict keyed by id(item)
+    bay_names = [bay.name for bay in self.scene.bay_items.values()]
     
+    combos = [self.bay_combo]
     # Also update the bay selector for paths
-    if hasattr(self, "bay_selector"):
-        bay_selector_text = self.bay_selector.currentText()
-        self.bay_selector.clear()
-        for bay in self.scene.bay_items:
-            self.bay_selector.addItem(bay.name)
+    if self.bay_selector is not None:
+        combos.append(self.bay_selector)
         
-        # Try to restore the previous selection
-        index = self.bay_selector.findText(bay_selector_text)
-        if index >= 0:
-            self.bay_selector.setCurrentIndex(index)
-    
-    # Try to restore the previous selection
-    index = self.bay_combo.findText(current_text)
-    if index >= 0:
-        self.bay_combo.setCurrentIndex(index)
\ No newline at end of file
+    for combo in combos:
+        current_text = combo.currentText()
+        # Refill in one batch; intermediate currentIndexChanged signals are pure noise
+        combo.blockSignals(True)
+        try:
+            combo.clear()
+            combo.addItems(bay_names)
+            
+            # Try to restore the previous selection
+            index = combo.findText(current_text)
+            if index >= 0:
+                combo.setCurrentIndex(index)
+        finally:
+            combo.blockSignals(False)
\ No newline at end of file
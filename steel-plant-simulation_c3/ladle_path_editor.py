@@ -12,6 +12,10 @@ handler.setFormatter(formatter)
 logger.addHandler(handler)
 logger.setLevel(logging.INFO)
 
+# Choices offered by the path type and name combos
+PATH_TYPES = ("Ladle Car", "Crane")
+PATH_NAME_SUGGESTIONS = ("Path 1", "Path 2", "Path 3", "Custom")
+
 class LadlePathEditor(QWidget):
     """Widget for editing ladle paths."""
     
@@ -24,6 +28,8 @@ class LadlePathEditor(QWidget):
         self.current_path = None
         self.path_drawing = False
         self.current_points = []
+        # Labels last shown in path_list, so unchanged lists are not repopulated
+        self._path_labels = None
         
         # Create UI
         self.create_ui()
@@ -68,7 +74,7 @@ class LadlePathEditor(QWidget):
         type_layout = QHBoxLayout()
         type_layout.addWidget(QLabel("Path Type:"))
         self.path_type_combo = QComboBox()
-        self.path_type_combo.addItems(["Ladle Car", "Crane"])
+        self.path_type_combo.addItems(PATH_TYPES)
         self.path_type_combo.currentIndexChanged.connect(self.on_path_type_changed)
         type_layout.addWidget(self.path_type_combo)
         path_edit_layout.addLayout(type_layout)
@@ -78,7 +84,7 @@ class LadlePathEditor(QWidget):
         name_layout.addWidget(QLabel("Path Name:"))
         self.path_name_combo = QComboBox()
         self.path_name_combo.setEditable(True)
-        self.path_name_combo.addItems(["Path 1", "Path 2", "Path 3", "Custom"])
+        self.path_name_combo.addItems(PATH_NAME_SUGGESTIONS)
         name_layout.addWidget(self.path_name_combo)
         path_edit_layout.addLayout(name_layout)
         
@@ -114,11 +120,29 @@ class LadlePathEditor(QWidget):
         
     def update_path_list(self):
         """Update the path list widget."""
-        self.path_list.clear()
+        labels = []
+        current_row = -1
         for i, path in enumerate(self.paths):
             path_name = path.get("name", f"Path {i+1}")
             path_type = path.get("type", "Ladle Car")
-            self.path_list.addItem(f"{path_name} ({path_type})")
+            labels.append(f"{path_name} ({path_type})")
+            if path is self.current_path:
+                current_row = i
+                
+        # Repopulate in one batch without firing on_path_selected for every intermediate state
+        self.path_list.blockSignals(True)
+        try:
+            if labels != self._path_labels:
+                self.path_list.clear()
+                self.path_list.addItems(labels)
+                self._path_labels = labels
+            # A row of -1 drops any stale selection, as clear() would have
+            self.path_list.setCurrentRow(current_row)
+        finally:
+            self.path_list.blockSignals(False)
+            
+        if current_row < 0:
+            self.current_path = None
         
     def on_path_selected(self, index):
         """Handle path selection."""
@@ -143,7 +167,11 @@ class LadlePathEditor(QWidget):
     def on_path_type_changed(self, index):
         """Handle path type changes."""
         if self.current_path:
-            self.current_path["type"] = self.path_type_combo.currentText()
+            path_type = self.path_type_combo.currentText()
+            # Syncing the combo to the selected path is not a change
+            if self.current_path.get("type", "Ladle Car") == path_type:
+                return
+            self.current_path["type"] = path_type
             self.update_path_list()
         
     def add_path(self):
@@ -200,6 +200,12 @@ class LoadingThread(QThread):
 class ConfigPanel(QWidget):
     """Panel for simulation configuration settings."""
     
+    _BG_FILTER = "Image Files (*.png *.jpg *.jpeg *.bmp)"
+    _CAD_FILTER = (
+        "Supported Files (*.pdf *.dxf *.dwg *.svg);;PDF Files (*.pdf);;"
+        "DXF Files (*.dxf);;DWG Files (*.dwg);;SVG Files (*.svg)"
+    )
+    
     def __init__(self, config, parent=None):
         super().__init__(parent)
         self.config = config
@@ -419,8 +425,7 @@ class ConfigPanel(QWidget):
     def browse_background_image(self):
         """Open file dialog to select background image."""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select Background Image", "", 
-            "Image Files (*.png *.jpg *.jpeg *.bmp)"
+            self, "Select Background Image", "", self._BG_FILTER
         )
         if file_path:
             self.bg_image_label.setText(file_path)
@@ -433,8 +438,7 @@ class ConfigPanel(QWidget):
     def browse_cad_file(self):
         """Open file dialog to select CAD or PDF file."""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select CAD or PDF File", "", 
-            "Supported Files (*.pdf *.dxf *.dwg *.svg);;PDF Files (*.pdf);;DXF Files (*.dxf);;DWG Files (*.dwg);;SVG Files (*.svg)"
+            self, "Select CAD or PDF File", "", self._CAD_FILTER
         )
         if file_path:
             self.cad_label.setText(file_path)
@@ -502,6 +506,10 @@ class ConfigPanel(QWidget):
 
 class SimulationApp(QMainWindow):
     """Main application window for the simulation."""
+    
+    # Theme icons by name, shared by every window; filled by _theme_icon
+    _THEME_ICONS = {}
+    
     def __init__(self, config):
         super().__init__()
         # Ensure we have a proper config object
@@ -612,19 +620,19 @@ class SimulationApp(QMainWindow):
         
         # Equipment Layout button
         equipment_btn = QPushButton("Equipment Layout")
-        equipment_btn.setIcon(QIcon.fromTheme("preferences-system"))
+        equipment_btn.setIcon(self._theme_icon("preferences-system"))
         equipment_btn.clicked.connect(self.show_equipment_layout)
         toolbar_layout.addWidget(equipment_btn)
         
         # Production Settings button
         production_btn = QPushButton("Production Settings")
-        production_btn.setIcon(QIcon.fromTheme("preferences-desktop"))
+        production_btn.setIcon(self._theme_icon("preferences-desktop"))
         production_btn.clicked.connect(self.show_production_settings)
         toolbar_layout.addWidget(production_btn)
         
         # Load CAD button
         cad_btn = QPushButton("Load CAD")
-        cad_btn.setIcon(QIcon.fromTheme("document-open"))
+        cad_btn.setIcon(self._theme_icon("document-open"))
         cad_btn.clicked.connect(self.show_cad_import)
         toolbar_layout.addWidget(cad_btn)
 
@@ -642,11 +650,19 @@ class SimulationApp(QMainWindow):
     def _create_button(self, text, icon, slot, enabled):
         """Helper to create styled buttons."""
         btn = QPushButton(text)
-        btn.setIcon(QIcon.fromTheme(icon))
+        btn.setIcon(self._theme_icon(icon))
         btn.clicked.connect(slot)
         btn.setEnabled(enabled)
         return btn
 
+    @classmethod
+    def _theme_icon(cls, name):
+        """Return the theme icon for name, resolving it only on first use."""
+        icon = cls._THEME_ICONS.get(name)
+        if icon is None:
+            icon = cls._THEME_ICONS[name] = QIcon.fromTheme(name)
+        return icon
+
     def load_simulation(self):
         """Start background loading of simulation components."""
         self.loading_thread = LoadingThread(self.config)
@@ -1219,7 +1235,7 @@ class SimulationApp(QMainWindow):
         self.is_running = not self.is_running
         self.env.paused = not self.is_running
         self.run_button.setText("Pause" if self.is_running else "Run")
-        self.run_button.setIcon(QIcon.fromTheme("media-playback-pause" if self.is_running else "media-playback-start"))
+        self.run_button.setIcon(self._theme_icon("media-playback-pause" if self.is_running else "media-playback-start"))
         self.status_label.setText("Simulation running" if self.is_running else "Simulation paused")
         
         # Enable animation mode automatically when running
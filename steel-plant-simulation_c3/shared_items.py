@@ -3,6 +3,15 @@ from PyQt5.QtWidgets import (QGraphicsItem, QGraphicsEllipseItem, QGraphicsPathI
 from PyQt5.QtGui import (QPen, QBrush, QColor, QPainterPath)
 from PyQt5.QtCore import (Qt, QPointF)
 
+# Pens and brushes shared by every route item; built once instead of per hover event
+ROUTE_POINT_BRUSH = QBrush(QColor(200, 200, 100, 150))
+ROUTE_POINT_HOVER_BRUSH = QBrush(QColor(255, 255, 100, 200))
+ROUTE_POINT_PEN = QPen(QColor(100, 100, 0), 2)
+
+# (normal, hover) pens for crane routes and for all other route types
+CRANE_ROUTE_PENS = (QPen(QColor(255, 100, 100), 3, Qt.DashLine), QPen(QColor(255, 0, 0), 4, Qt.DashLine))
+ROUTE_PENS = (QPen(QColor(100, 100, 255), 3, Qt.DashLine), QPen(QColor(0, 0, 255), 4, Qt.DashLine))
+
 class RoutePointItem(QGraphicsEllipseItem):
     """Graphics item representing a route point in the layout."""
     
@@ -12,23 +21,28 @@ class RoutePointItem(QGraphicsEllipseItem):
         self.setFlag(QGraphicsItem.ItemIsMovable, True)
         self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
         self.setAcceptHoverEvents(True)
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         
         # Set up appearance
-        self.setBrush(QBrush(QColor(200, 200, 100, 150)))
-        self.setPen(QPen(QColor(100, 100, 0), 2))
+        self.setBrush(ROUTE_POINT_BRUSH)
+        self.setPen(ROUTE_POINT_PEN)
         
-    def paint(self, painter, option, widget=None):
-        """Paint the route point item."""
-        super().paint(painter, option, widget)
+    def itemChange(self, change, value):
+        """Keep attached route paths in step when the point moves."""
+        if change == QGraphicsItem.ItemPositionHasChanged:
+            scene = self.scene()
+            if scene is not None and hasattr(scene, "update_routes_for"):
+                scene.update_routes_for(self)
+        return super().itemChange(change, value)
         
     def hoverEnterEvent(self, event):
         """Handle hover enter events."""
-        self.setBrush(QBrush(QColor(255, 255, 100, 200)))
+        self.setBrush(ROUTE_POINT_HOVER_BRUSH)
         super().hoverEnterEvent(event)
         
     def hoverLeaveEvent(self, event):
         """Handle hover leave events."""
-        self.setBrush(QBrush(QColor(200, 200, 100, 150)))
+        self.setBrush(ROUTE_POINT_BRUSH)
         super().hoverLeaveEvent(event)
         
     def get_data(self):
@@ -49,13 +63,16 @@ class RoutePathItem(QGraphicsPathItem):
         self.end_item = end_item
         self.route_type = route_type
         self.setAcceptHoverEvents(True)
+        # Geometry follows the endpoints, so a cached pixmap would rarely be reused
+        self.setCacheMode(QGraphicsItem.NoCache)
         
         # Set up appearance
-        if route_type == "crane":
-            self.setPen(QPen(QColor(255, 100, 100), 3, Qt.DashLine))
-        else:
-            self.setPen(QPen(QColor(100, 100, 255), 3, Qt.DashLine))
+        self.pens = CRANE_ROUTE_PENS if route_type == "crane" else ROUTE_PENS
+        self.setPen(self.pens[0])
             
+        # Endpoint positions the current path was built from
+        self._endpoints = None
+        
         # Create the path
         self.update_path()
         
@@ -67,31 +84,25 @@ class RoutePathItem(QGraphicsPathItem):
         end_center = self.end_item.rect().center()
         end_pos = self.end_item.pos() + end_center
         
+        # Leave the geometry alone when neither endpoint has moved
+        endpoints = (start_pos, end_pos)
+        if endpoints == self._endpoints:
+            return
+        self._endpoints = endpoints
+        
         path = QPainterPath()
         path.moveTo(start_pos)
         path.lineTo(end_pos)
         self.setPath(path)
         
-    def paint(self, painter, option, widget=None):
-        """Paint the route path item."""
-        # Make sure the path is updated before painting
-        self.update_path()
-        super().paint(painter, option, widget)
-        
     def hoverEnterEvent(self, event):
         """Handle hover enter events."""
-        if self.route_type == "crane":
-            self.setPen(QPen(QColor(255, 0, 0), 4, Qt.DashLine))
-        else:
-            self.setPen(QPen(QColor(0, 0, 255), 4, Qt.DashLine))
+        self.setPen(self.pens[1])
         super().hoverEnterEvent(event)
         
     def hoverLeaveEvent(self, event):
         """Handle hover leave events."""
-        if self.route_type == "crane":
-            self.setPen(QPen(QColor(255, 100, 100), 3, Qt.DashLine))
-        else:
-            self.setPen(QPen(QColor(100, 100, 255), 3, Qt.DashLine))
+        self.setPen(self.pens[0])
         super().hoverLeaveEvent(event)
         
     def get_data(self):
@@ -0,0 +1,403 @@
+import sys
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Render off screen so the tests run without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Add the project root to the path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt5.QtWidgets import QApplication, QDialog
+from PyQt5.QtCore import Qt, QPointF
+
+app = QApplication.instance() or QApplication([])
+
+from equipment_layout_editor import (EquipmentLayoutEditor, LayoutScene, EquipmentItem, BayItem,
+                                     show_equipment_layout_editor)
+from shared_items import RoutePointItem, RoutePathItem
+
+class TestLayoutSceneBayIndex(unittest.TestCase):
+    """Test case for the scene's bay name index."""
+
+    def setUp(self):
+        """Set up a scene with two bays."""
+        self.scene = LayoutScene()
+        self.bay_1 = BayItem(0, 0, 300, 200, "bay_1", "bay_1")
+        self.bay_2 = BayItem(0, 300, 300, 200, "bay_2", "bay_2")
+        self.scene.addItem(self.bay_1)
+        self.scene.addItem(self.bay_2)
+
+    def test_lookup_by_name(self):
+        """Test that each bay is found by its name."""
+        self.assertIs(self.scene.bay_index.get("bay_1"), self.bay_1)
+        self.assertIs(self.scene.bay_index.get("bay_2"), self.bay_2)
+
+    def test_rename_onto_existing_name_then_remove(self):
+        """Test that removing a renamed namesake leaves the original bay indexed."""
+        self.scene.rename_bay(self.bay_1, "bay_2")
+        # The first bay in insertion order wins, as a scan of the bays would
+        self.assertIs(self.scene.bay_index.get("bay_2"), self.bay_1)
+        self.assertNotIn("bay_1", self.scene.bay_index)
+
+        self.scene.removeItem(self.bay_1)
+        self.assertIs(self.scene.bay_index.get("bay_2"), self.bay_2)
+
+    def test_duplicate_name_on_add_keeps_first(self):
+        """Test that adding a bay with a taken name does not replace the first one."""
+        duplicate = BayItem(400, 0, 100, 100, "bay_3", "bay_1")
+        self.scene.addItem(duplicate)
+        self.assertIs(self.scene.bay_index.get("bay_1"), self.bay_1)
+
+        self.scene.removeItem(self.bay_1)
+        self.assertIs(self.scene.bay_index.get("bay_1"), duplicate)
+
+        self.scene.removeItem(duplicate)
+        self.assertNotIn("bay_1", self.scene.bay_index)
+
+    def test_clear_empties_index(self):
+        """Test that clearing the scene empties the bay index."""
+        self.scene.clear()
+        self.assertEqual(self.scene.bay_index, {})
+
+class TestLayoutDataCache(unittest.TestCase):
+    """Test case for the editor's cached layout data."""
+
+    def setUp(self):
+        """Set up an editor holding one equipment item and one bay."""
+        config = {
+            "equipment_positions": [{"x": 10, "y": 20, "width": 50, "height": 60,
+                                     "equipment_type": "EAF", "equipment_id": "eaf_1", "name": "EAF 1"}],
+            "bays": [{"x": 0, "y": 0, "width": 300, "height": 200, "bay_id": "bay_1", "name": "Bay 1"}],
+        }
+        self.editor = EquipmentLayoutEditor(current_config=config)
+        self.scene = self.editor.scene
+        self.equipment = next(iter(self.scene.equipment_items.values()))
+        self.bay = next(iter(self.scene.bay_items.values()))
+        self.data = self.editor.collect_layout_data()
+
+    def tearDown(self):
+        """Release the editor."""
+        self.editor.deleteLater()
+
+    def assertRebuilt(self):
+        """Assert that the next collection rebuilds the data, and return it."""
+        self.assertTrue(self.scene.is_dirty())
+        data = self.editor.collect_layout_data()
+        self.assertIsNot(data, self.data)
+        self.assertFalse(self.scene.is_dirty())
+        return data
+
+    def test_clean_call_returns_cached_data(self):
+        """Test that an unchanged layout is not collected again."""
+        self.assertFalse(self.scene.is_dirty())
+        self.assertIs(self.editor.collect_layout_data(), self.data)
+
+    def test_equipment_move(self):
+        """Test that moving equipment invalidates the cache."""
+        self.equipment.setPos(40, 0)
+        self.assertEqual(self.assertRebuilt()["equipment_positions"][0]["x"], 40)
+
+    def test_bay_move(self):
+        """Test that moving a bay invalidates the cache."""
+        self.bay.setPos(0, 25)
+        self.assertEqual(self.assertRebuilt()["bays"][0]["y"], 25)
+
+    def test_equipment_edit_name(self):
+        """Test that renaming equipment invalidates the cache."""
+        with patch("equipment_layout_editor.QInputDialog.getText", return_value=("Furnace", True)):
+            self.equipment.edit_name()
+        self.assertEqual(self.assertRebuilt()["equipment_positions"][0]["name"], "Furnace")
+
+    def test_bay_edit_name(self):
+        """Test that renaming a bay through its dialog invalidates the cache."""
+        with patch("equipment_layout_editor.QInputDialog.getText", return_value=("Melt Shop", True)):
+            self.bay.edit_name()
+        self.assertEqual(self.assertRebuilt()["bays"][0]["name"], "Melt Shop")
+
+    def test_rename_bay(self):
+        """Test that renaming a bay on the scene invalidates the cache."""
+        self.scene.rename_bay(self.bay, "Caster Bay")
+        self.assertEqual(self.assertRebuilt()["bays"][0]["name"], "Caster Bay")
+
+    def test_add(self):
+        """Test that adding items invalidates the cache."""
+        self.scene.addItem(EquipmentItem(200, 200, 50, 50, "LMF", "lmf_1", "LMF 1"))
+        self.assertEqual(len(self.assertRebuilt()["equipment_positions"]), 2)
+
+        self.data = self.editor.collect_layout_data()
+        self.editor.add_bay()
+        self.assertEqual(len(self.assertRebuilt()["bays"]), 2)
+
+    def test_remove(self):
+        """Test that removing items invalidates the cache."""
+        self.scene.removeItem(self.equipment)
+        self.assertEqual(self.assertRebuilt()["equipment_positions"], [])
+
+        self.data = self.editor.collect_layout_data()
+        self.scene.removeItem(self.bay)
+        self.assertEqual(self.assertRebuilt()["bays"], [])
+
+    def test_clear(self):
+        """Test that clearing the scene invalidates the cache."""
+        self.scene.clear()
+        data = self.assertRebuilt()
+        self.assertEqual(data["equipment_positions"], [])
+        self.assertEqual(data["bays"], [])
+
+class TestLayoutSceneBayChanged(unittest.TestCase):
+    """Test case for the scene's bay_changed notifications."""
+
+    def setUp(self):
+        """Set up an editor and record the bay changes its scene announces."""
+        config = {"bays": [{"x": 0, "y": 0, "width": 300, "height": 200, "bay_id": "bay_1", "name": "Bay 1"}]}
+        self.editor = EquipmentLayoutEditor(current_config=config)
+        self.scene = self.editor.scene
+        self.changes = []
+        self.scene.bay_changed.connect(lambda *change: self.changes.append(change))
+
+    def tearDown(self):
+        """Release the editor."""
+        self.editor.deleteLater()
+
+    def test_load_emits_single_reset(self):
+        """Test that reloading the layout announces one reset and no per-bay adds."""
+        self.editor.load_layout_data()
+        self.assertEqual(self.changes, [("reset", "", "")])
+        self.assertEqual(len(self.scene.bay_items), 1)
+
+    def test_clear_emits_reset(self):
+        """Test that clearing the scene outside a load announces a reset."""
+        self.scene.clear()
+        self.assertEqual(self.changes, [("reset", "", "")])
+
+    def test_single_bay_changes(self):
+        """Test that adding, renaming and removing a bay are announced one by one."""
+        bay = BayItem(0, 300, 100, 100, "bay_2", "Bay 2")
+        self.scene.addItem(bay)
+        self.scene.rename_bay(bay, "Bay 3")
+        self.scene.removeItem(bay)
+        self.assertEqual(self.changes, [("add", "Bay 2", ""), ("rename", "Bay 3", "Bay 2"), ("remove", "Bay 3", "")])
+
+class TestLayoutSceneRoutes(unittest.TestCase):
+    """Test case for routes following their endpoints."""
+
+    def setUp(self):
+        """Set up a route point and an equipment item joined to a second point."""
+        self.scene = LayoutScene()
+        self.point = RoutePointItem(100, 100)
+        self.end = RoutePointItem(300, 100)
+        self.equipment = EquipmentItem(0, 200, 50, 50, "EAF", "eaf_1", "EAF 1")
+        for item in (self.point, self.end, self.equipment):
+            self.scene.addItem(item)
+        self.route = RoutePathItem(self.point, self.end)
+        self.equipment_route = RoutePathItem(self.equipment, self.end)
+        for route in (self.route, self.equipment_route):
+            self.scene.addItem(route)
+            self.scene.routes.append(route)
+
+    def endpoints(self, route):
+        """Return the first and last points of a route's path."""
+        path = route.path()
+        first = path.elementAt(0)
+        last = path.elementAt(path.elementCount() - 1)
+        return QPointF(first.x, first.y), QPointF(last.x, last.y)
+
+    def test_route_follows_moved_point(self):
+        """Test that moving a route point rebuilds its route on the next event loop pass."""
+        self.point.setPos(0, 50)
+        app.processEvents()
+        self.assertEqual(self.endpoints(self.route), (QPointF(100, 150), QPointF(300, 100)))
+
+    def test_route_follows_moved_equipment(self):
+        """Test that moving an equipment endpoint rebuilds its route."""
+        self.equipment.setPos(100, 0)
+        app.processEvents()
+        self.assertEqual(self.endpoints(self.equipment_route), (QPointF(125, 225), QPointF(300, 100)))
+        # The route that does not touch the equipment is left alone
+        self.assertEqual(self.endpoints(self.route), (QPointF(100, 100), QPointF(300, 100)))
+
+    def test_shared_endpoint_updates_every_route(self):
+        """Test that a point shared by two routes moves both of them."""
+        self.end.setPos(0, 100)
+        app.processEvents()
+        self.assertEqual(self.endpoints(self.route)[1], QPointF(300, 200))
+        self.assertEqual(self.endpoints(self.equipment_route)[1], QPointF(300, 200))
+
+    def test_remove_route_trims_index(self):
+        """Test that removing a route detaches it from both endpoints."""
+        self.scene.removeItem(self.route)
+        self.assertEqual(self.scene.routes_by_item[id(self.point)], [])
+        self.assertEqual(self.scene.routes_by_item[id(self.end)], [self.equipment_route])
+
+    def test_remove_endpoint_drops_its_entry(self):
+        """Test that removing an endpoint drops its index entry."""
+        self.scene.removeItem(self.point)
+        self.assertNotIn(id(self.point), self.scene.routes_by_item)
+
+    def test_clear_routes_empties_index(self):
+        """Test that clear_routes removes every route and empties the index."""
+        self.scene.clear_routes()
+        self.assertEqual(self.scene.routes_by_item, {})
+        self.assertEqual(self.scene.route_points, {})
+        self.assertIsNone(self.route.scene())
+        self.assertIsNone(self.point.scene())
+        # Equipment is not a route item and stays in the scene
+        self.assertIs(self.equipment.scene(), self.scene)
+
+class TestLoadLayout(unittest.TestCase):
+    """Test case for loading a layout file into the editor."""
+
+    def setUp(self):
+        """Set up an editor holding one equipment item."""
+        self.config = {
+            "equipment_positions": [{"x": 10, "y": 20, "width": 50, "height": 60,
+                                     "equipment_type": "EAF", "equipment_id": "eaf_1", "name": "EAF 1"}],
+        }
+        self.editor = EquipmentLayoutEditor(current_config=self.config)
+
+    def tearDown(self):
+        """Release the editor."""
+        self.editor.deleteLater()
+
+    def load(self, layout_data):
+        """Load layout data through the file dialog, returning the warning mock."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "layout.json")
+            with open(file_path, "w") as f:
+                json.dump(layout_data, f)
+            with patch("equipment_layout_editor.QFileDialog.getOpenFileName", return_value=(file_path, "")), \
+                    patch("equipment_layout_editor.QMessageBox.warning") as warning:
+                self.editor.load_layout()
+        return warning
+
+    def equipment_ids(self):
+        """Return the ids of the equipment items in the scene."""
+        return [item.equipment_id for item in self.editor.scene.equipment_items.values()]
+
+    def test_load_replaces_layout(self):
+        """Test that a complete file replaces the configuration and scene."""
+        layout_data = {"equipment_positions": [{"x": 0, "y": 0, "width": 40, "height": 40,
+                                                "equipment_type": "LMF", "equipment_id": "lmf_1", "name": "LMF 1"}]}
+        warning = self.load(layout_data)
+        warning.assert_not_called()
+        self.assertEqual(self.editor.config, layout_data)
+        self.assertEqual(self.equipment_ids(), ["lmf_1"])
+
+    def test_missing_key_keeps_previous_layout(self):
+        """Test that a file missing a required key leaves the current layout in place."""
+        warning = self.load({"equipment_positions": [{"x": 0, "y": 0, "width": 40, "height": 40,
+                                                      "equipment_type": "LMF", "name": "LMF 1"}]})
+        warning.assert_called_once()
+        self.assertIs(self.editor.config, self.config)
+        self.assertEqual(self.equipment_ids(), ["eaf_1"])
+        self.assertEqual(self.editor.equipment_list.count(), 1)
+
+class TestShowEquipmentLayoutEditor(unittest.TestCase):
+    """Test case for committing the editor's layout to the simulation config."""
+
+    def setUp(self):
+        """Set up a simulation service whose config holds a layout and other settings."""
+        self.config = {
+            "equipment_positions": [{"x": 10, "y": 20, "width": 50, "height": 60,
+                                     "equipment_type": "EAF", "equipment_id": "eaf_1", "name": "EAF 1"}],
+            "bays": [{"x": 0, "y": 0, "width": 300, "height": 200, "bay_id": "bay_1", "name": "Bay 1"}],
+            "ladle_paths": [{"name": "Path 1", "waypoints": []}],
+            "takt_time": 60,
+        }
+        self.sim_service = type("SimService", (), {"config": self.config})()
+        self.dialogs = []
+
+    def show(self, loaded=None):
+        """Run the editor, optionally loading a layout, and accept it."""
+        def exec_(dialog):
+            self.dialogs.append(dialog)
+            if loaded is not None:
+                dialog.config = loaded
+                dialog.load_layout_data()
+            dialog.save_and_close()
+            return QDialog.Accepted
+        with patch.object(EquipmentLayoutEditor, "exec_", exec_):
+            return show_equipment_layout_editor(self.sim_service)
+
+    def test_loaded_layout_replaces_layout_keys(self):
+        """Test that a loaded layout drops layout keys it lacks but keeps other settings."""
+        self.show({"equipment_positions": [{"x": 0, "y": 0, "width": 40, "height": 40,
+                                            "equipment_type": "LMF", "equipment_id": "lmf_1", "name": "LMF 1"}]})
+        self.assertEqual([e["equipment_id"] for e in self.config["equipment_positions"]], ["lmf_1"])
+        self.assertEqual(self.config["bays"], [])
+        self.assertNotIn("ladle_paths", self.config)
+        self.assertEqual(self.config["takt_time"], 60)
+
+    def test_config_does_not_share_cached_lists(self):
+        """Test that the live config gets its own copy of the cached layout lists."""
+        self.show()
+        cache = self.dialogs[0].collect_layout_data()
+        self.assertEqual(self.config["equipment_positions"], cache["equipment_positions"])
+        self.assertIsNot(self.config["equipment_positions"], cache["equipment_positions"])
+        self.assertIsNot(self.config["equipment_positions"][0], cache["equipment_positions"][0])
+
+    def test_loaded_layout_does_not_share_cached_lists(self):
+        """Test that a loaded layout is copied into the live config."""
+        self.show({"equipment_positions": []})
+        cache = self.dialogs[0].collect_layout_data()
+        self.assertIsNot(self.config["bays"], cache["bays"])
+
+class FakeClick:
+    """Minimal stand-in for a left-button scene mouse release at a scene position."""
+
+    def __init__(self, x, y):
+        self.pos = QPointF(x, y)
+
+    def scenePos(self):
+        return self.pos
+
+    def button(self):
+        return Qt.LeftButton
+
+    def accept(self):
+        pass
+
+class TestLayoutScenePathSnap(unittest.TestCase):
+    """Test case for snapping path points while drawing routes."""
+
+    def setUp(self):
+        """Set up a scene in path drawing mode."""
+        self.scene = LayoutScene()
+        self.scene.set_ladle_path_mode(True)
+
+    def click(self, x, y):
+        """Release the mouse at a scene position."""
+        self.scene.mouseReleaseEvent(FakeClick(x, y))
+
+    def centers(self):
+        """Return the scene centers of the points drawn so far."""
+        return [point.sceneBoundingRect().center() for point in self.scene.current_path_points]
+
+    def test_snaps_to_nearest_grid_line(self):
+        """Test that clicks snap to the nearest multiple of the grid size."""
+        self.click(101, 99)
+        self.click(-31, 10.5)
+        self.click(-30.5, -9.5)
+        self.assertEqual(self.centers(), [QPointF(100, 100), QPointF(-40, 20), QPointF(-40, 0)])
+        self.assertEqual(len(self.scene.routes), 2)
+
+    def test_snaps_to_nearest_grid_line_on_odd_grid(self):
+        """Test that clicks round to the nearest grid line when the grid size is odd."""
+        self.scene.grid_size = 25
+        self.click(12.7, 37.6)
+        self.click(-12.7, -37.6)
+        self.assertEqual(self.centers(), [QPointF(25, 50), QPointF(-25, -50)])
+
+    def test_repeat_click_adds_point(self):
+        """Test that a click snapping onto the previous point still adds a point."""
+        self.click(101, 99)
+        self.click(95, 105)
+        self.assertEqual(self.centers(), [QPointF(100, 100), QPointF(100, 100)])
+        self.assertEqual(len(self.scene.routes), 1)
+
+if __name__ == '__main__':
+    unittest.main()